@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import math
@@ -586,13 +587,20 @@ class StateEngine:
 
 
 class _Handler(BaseHTTPRequestHandler):
+    # HTTP/1.1 so the overlay's 5 Hz /state polling can reuse one keep-alive connection.
+    protocol_version = "HTTP/1.1"
+
     def do_GET(self) -> None:
         if self.path.startswith("/state"):
-            self._write_json(200, self.server.engine.get_state())  # type: ignore[attr-defined]
+            self._write_json(200, self.server.engine.get_state(), etag=True)  # type: ignore[attr-defined]
             return
         self._write_json(404, {"error": "not found"})
 
     def do_POST(self) -> None:
+        # Drain the (unused) request body so it is not parsed as the next request on a kept-alive connection.
+        n = int(self.headers.get("Content-Length") or 0)
+        if n > 0:
+            self.rfile.read(n)
         if self.path.startswith("/run_diagnostic"):
             self._write_json(200, self.server.engine.trigger_diagnostic())  # type: ignore[attr-defined]
             return
@@ -609,9 +617,19 @@ class _Handler(BaseHTTPRequestHandler):
     def log_message(self, fmt: str, *args) -> None:
         log.debug("HTTP: " + fmt, *args)
 
-    def _write_json(self, code: int, obj: Dict[str, object]) -> None:
+    def _write_json(self, code: int, obj: Dict[str, object], etag: bool = False) -> None:
         raw = json.dumps(obj).encode("utf-8")
+        if etag:
+            # Pollers resend the tag; an unchanged payload costs them a bodiless 304 instead of a JSON parse.
+            tag = '"' + hashlib.blake2b(raw, digest_size=8).hexdigest() + '"'
+            if self.headers.get("If-None-Match") == tag:
+                self.send_response(304)
+                self.send_header("ETag", tag)
+                self.end_headers()
+                return
         self.send_response(code)
+        if etag:
+            self.send_header("ETag", tag)
         self.send_header("Content-Type", "application/json")
         self.send_header("Content-Length", str(len(raw)))
         self.end_headers()
@@ -2,33 +2,62 @@ from __future__ import annotations
 
 import argparse
 import ctypes
+import functools
+import http.client
 import json
 import logging
-import math
 import os
 import random
+import threading
 import time
-import urllib.request
+import urllib.parse
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Dict, Optional, Tuple
 
 import openvr
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QColor, QFont, QGuiApplication, QImage, QPainter, QPen
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QGuiApplication, QImage, QPainter, QPen, QStaticText
 
 from lighthouse_layout_coach.chaperone import PlayArea
 from lighthouse_layout_coach.log_data import LogDataProvider
 from lighthouse_layout_coach.logging_setup import setup_logging
 from vr_overlay.vr_coach import VRCoachOverlay, VRCoachToggles
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used when it's not installed
+    orjson = None
+
 
 log = logging.getLogger("llc.overlay")
 
+# Bound once: these are matched on every SetOverlayRaw failure.
+_ERR_REQUEST_FAILED = openvr.error_code.OverlayError_RequestFailed
+_ERR_INVALID_HANDLE = openvr.error_code.OverlayError_InvalidHandle
+_INVALID_OVERLAY_HANDLE = int(getattr(openvr, "k_ulOverlayHandleInvalid", 0) or 0)
+# Event types _pump_events dispatches on, resolved once instead of per polled event.
+_EVENT_MOUSE_MOVE = int(getattr(openvr, "VREvent_MouseMove", 300))
+_EVENT_MOUSE_DOWN = int(getattr(openvr, "VREvent_MouseButtonDown", 200))
+
+
+# (interface type, camelCase name) -> attribute name that exists on it; the binding's API shape is fixed at runtime.
+_METHOD_NAMES: Dict[Tuple[type, str], str] = {}
+
+# Serializes calls on the shared IVROverlay: the VR Coach uploads from its render worker while the main loop
+# submits, polls events and queries it. Reentrant so a locked section may go through _safe_call.
+_OPENVR_LOCK = threading.RLock()
+
 
 def _safe_call(obj, pascal: str, camel: str, *args, **kwargs):
-    fn = camel if hasattr(obj, camel) else pascal
+    key = (type(obj), camel)
+    fn = _METHOD_NAMES.get(key)
+    if fn is None:
+        fn = _METHOD_NAMES[key] = camel if hasattr(obj, camel) else pascal
     try:
-        return getattr(obj, fn)(*args, **kwargs)
+        with _OPENVR_LOCK:
+            return getattr(obj, fn)(*args, **kwargs)
     except Exception as e:
         # openvr raises specific exception types like openvr.error_code.OverlayError_RequestFailed
         # via its error_code check wrapper; the exception class name is the enum name.
@@ -36,6 +65,55 @@ def _safe_call(obj, pascal: str, camel: str, *args, **kwargs):
         raise
 
 
+@functools.lru_cache(maxsize=8)
+def _ubyte_array(nbytes: int):
+    # Frame shapes are fixed for a session; reuse the ctypes array type instead of rebuilding it per submit.
+    return ctypes.c_ubyte * nbytes
+
+
+def _json_loads(raw: bytes):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _bind_method(obj, pascal: str, camel: str):
+    # pyopenvr wrappers expose camelCase methods; older bindings used PascalCase. Resolve once, not per call.
+    fn = getattr(obj, camel, None)
+    if fn is None:
+        fn = getattr(obj, pascal, None)
+    return fn
+
+
+def _set_timer_resolution(enabled: bool) -> bool:
+    # Windows' default timer resolution (~15.6 ms) is too coarse for frame pacing; request 1 ms while running.
+    if os.name != "nt":
+        return False
+    try:
+        winmm = ctypes.WinDLL("winmm")
+        if enabled:
+            return int(winmm.timeBeginPeriod(1)) == 0
+        winmm.timeEndPeriod(1)
+    except Exception:
+        pass
+    return False
+
+
+def _sleep_until(deadline: float, spin_s: float = 0.001) -> None:
+    # Coarse OS sleep to just before the deadline, then spin the remainder for sub-millisecond accuracy.
+    # `deadline` is on the time.perf_counter() clock: on Windows time.monotonic() only ticks every ~15.6 ms,
+    # which would turn the 1 ms spin into up to a full tick of busy-waiting.
+    remaining = deadline - time.perf_counter()
+    if remaining > spin_s:
+        time.sleep(remaining - spin_s)
+    while time.perf_counter() < deadline:
+        pass
+
+
+# Buttons whose label tracks live toggle/coach state; every other button's label is static chrome.
+_TOGGLE_BUTTON_IDS = frozenset(("coach", "history", "heatmap", "body"))
+
+
 @dataclass(frozen=True)
 class Button:
     id: str
@@ -53,9 +131,22 @@ class DashboardOverlayClient:
         self.w, self.h = 1024, 768
         self.toggles = VRCoachToggles()
         self._coach: Optional[VRCoachOverlay] = None
+        # Keep-alive connection to the state server, one per calling thread (state poller GETs, event-pump POSTs).
+        url = urllib.parse.urlsplit(self.state_url)
+        self._http_conn_cls = http.client.HTTPSConnection if url.scheme == "https" else http.client.HTTPConnection
+        self._http_host = url.hostname or "127.0.0.1"
+        self._http_port = url.port
+        self._http_prefix = url.path
+        self._http_local = threading.local()
+        # path -> (ETag, parsed body) of the last GET; a 304 reply reuses the parsed body.
+        self._json_cache: Dict[str, Tuple[str, Dict]] = {}
         self._logs = LogDataProvider()
         self._history_heatmap: Optional[Dict] = None
         self._history_heatmap_key: Optional[tuple] = None
+        # Heatmap recomputes run on a single worker so the frame loop never blocks on log ingestion.
+        self._heatmap_exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix="llc-heatmap")
+        self._pending_hm_future: Optional[Future] = None
+        self._pending_hm_key: Optional[tuple] = None
 
         self.buttons = [
             Button("coach", (28, 680, 240, 60), "Launch VR Coach"),
@@ -65,11 +156,23 @@ class DashboardOverlayClient:
             Button("diagnostic", (28, 608, 300, 56), "Run 60s Diagnostic"),
             Button("recompute", (350, 608, 300, 56), "Recompute"),
         ]
+        # 32 px tiles -> buttons overlapping that tile; event hit-tests only check the buttons under the cursor.
+        self._button_grid: Dict[Tuple[int, int], Tuple[Button, ...]] = {}
+        for b in self.buttons:
+            rx, ry, rw, rh = b.rect
+            for ty in range(ry >> 5, ((ry + rh) >> 5) + 1):
+                for tx in range(rx >> 5, ((rx + rw) >> 5) + 1):
+                    self._button_grid[(tx, ty)] = self._button_grid.get((tx, ty), ()) + (b,)
 
         self.overlay = None
+        # OpenVR entry points resolved once in start(); the binding's API shape does not change at runtime.
+        self._poll_event_fn = None
+        self._find_overlay_fn = None
+        self._set_overlay_raw_fn = None
         self.handle = None
         self.thumb = None
         self._openvr_inited = False
+        self._timer_resolution_set = False
 
         # Stability + diagnostics (rate-limited logging; no per-frame spam)
         self.overlay_created_count = 0
@@ -79,15 +182,67 @@ class DashboardOverlayClient:
         self.recreate_count = 0
         self.last_error: Optional[str] = None
 
-        self._next_submit_time = 0.0
+        self._submit_bufs: Dict[Tuple[int, int, int], ctypes.Array] = {}
+        # Submit retry/backoff state, per overlay handle so a failing thumbnail never throttles the dashboard.
+        self._next_submit_time: Dict[object, float] = {}
+        self._submit_retry_attempt: Dict[object, int] = {}
+        # RequestFailed pauses that outlasted the quick retries, since the handle's last accepted frame.
+        self._consecutive_failures: Dict[object, int] = {}
+        # The thumbnail is submitted once per overlay; run() re-drives it until OpenVR accepts it.
+        self._thumb_img: Optional[QImage] = None
+        self._thumb_submitted = False
         self._last_diag_time = 0.0
         self._last_error_log_time = 0.0
         self._last_recreate_time = 0.0
         self._recreate_cooldown_s = 5.0
         self._last_submit_ok_time: Optional[float] = None
 
+        # Latest /state reply, written by the StatePoller thread so HTTP latency never stalls the frame loop.
         self._cached_state: Dict = {}
-        self._next_state_fetch_time = 0.0
+        self._state_lock = threading.Lock()
+        self._state_stop = threading.Event()
+        self._state_thread = threading.Thread(target=self._state_poll_loop, name="StatePoller", daemon=True)
+        # The panel is repainted into one persistent image, and only when the inputs it was drawn from change.
+        # _render_gen counts repaints; the run loop resubmits only when it differs from the last accepted one.
+        # Painted in QPainter's native ARGB32_Premultiplied (its fast blend path). Each repaint then produces a
+        # fresh RGBA8888 image (the layout OpenVR reads) with convertToFormat: ~0.3 ms including the allocation,
+        # where a CompositionMode_Source blit into a persistent RGBA8888 image measured ~1.5 ms.
+        self._frame_img = QImage(self.w, self.h, QImage.Format.Format_ARGB32_Premultiplied)
+        self._frame_out: Optional[QImage] = None
+        # Static chrome (background, title, headings, idle buttons) per background variant, painted once.
+        self._base_imgs: Dict[bool, QImage] = {}
+        # Toggle-button labels come from a small fixed vocabulary; keep their shaped glyph runs.
+        self._label_texts: Dict[str, QStaticText] = {}
+        self._label_ascent: Optional[int] = None
+        self._render_key: Optional[tuple] = None
+        self._render_gen = 0
+        self._submitted_gen = -1
+        # Repaint at the 5 Hz state cadence; the run loop keeps pumping input events at the full frame rate.
+        self._render_period_s = 0.2
+        self._next_render_time = 0.0
+
+        # Paint resources, built once instead of on every repaint.
+        self._font_title = QFont("Segoe UI", 18)
+        self._font_title.setBold(True)
+        self._font_body = QFont("Segoe UI", 12)
+        self._font_heading = QFont("Segoe UI", 13, weight=QFont.Weight.DemiBold)
+        self._font_mono = QFont("Consolas", 11)
+        self._font_button = QFont("Segoe UI", 10, weight=QFont.Weight.DemiBold)
+        self._pen_border = QPen(QColor(90, 90, 90), 2)
+        self._color_bg = QColor(18, 18, 18)
+        self._color_bg_clicked = QColor(26, 40, 60)
+        self._color_title = QColor(235, 235, 235)
+        self._color_caption = QColor(190, 190, 190)
+        self._color_heading = QColor(220, 220, 220)
+        self._color_text = QColor(200, 200, 200)
+        self._color_ok = QColor(120, 220, 160)
+        self._color_warn = QColor(255, 170, 120)
+        self._color_button = QColor(30, 30, 30)
+        self._color_button_hover = QColor(48, 48, 48)
+        self._color_button_text = QColor(230, 230, 230)
+        self._color_cursor = QColor(255, 255, 255, 140)
+        # (w, h, crc32) of the pixels each overlay handle last accepted; byte-identical frames are not resent.
+        self._submitted_crc: Dict[object, Tuple[int, int, int]] = {}
 
         self._dashboard_key = "lighthouse.layout.coach"
         self._dashboard_name = "Lighthouse Layout Coach"
@@ -103,6 +258,10 @@ class DashboardOverlayClient:
         self._click_toggle = False
         self._click_count = 0
         self._logged_first_event_by_handle: dict[int, bool] = {}
+        # Once a handle is seen delivering events, poll only that one; re-probe both after a quiet period.
+        self._active_event_handle: Optional[int] = None
+        self._last_event_time = 0.0
+        self._active_event_handle_timeout_s = 5.0
 
     def _mouse_coords_to_px(self, x: float, y: float) -> Tuple[float, float]:
         """
@@ -135,7 +294,11 @@ class DashboardOverlayClient:
             raise init_last
 
         self._openvr_inited = True
+        self._timer_resolution_set = _set_timer_resolution(True)
         self.overlay = openvr.VROverlay()
+        self._poll_event_fn = _bind_method(self.overlay, "PollNextOverlayEvent", "pollNextOverlayEvent")
+        self._find_overlay_fn = _bind_method(self.overlay, "FindOverlay", "findOverlay")
+        self._set_overlay_raw_fn = _bind_method(self.overlay, "SetOverlayRaw", "setOverlayRaw")
         try:
             self._create_or_recreate_overlay()
         except openvr.error_code.OverlayError_KeyInUse as e:
@@ -146,8 +309,17 @@ class DashboardOverlayClient:
         self._configure_overlay()
         self._show_dashboard()
 
-        if self.thumb is not None:
-            thumb_img = QImage(256, 256, QImage.Format.Format_RGBA8888)
+        self._submit_thumb()
+
+        # One blocking fetch so the first frame is drawn from real state, then the StatePoller keeps it fresh.
+        self._cached_state = self._get_json("/state")
+        self._state_thread.start()
+
+    def _submit_thumb(self) -> None:
+        if self._thumb_submitted or self.thumb is None:
+            return
+        if self._thumb_img is None:
+            thumb_img = QImage(256, 256, QImage.Format.Format_ARGB32_Premultiplied)
             thumb_img.fill(QColor(30, 30, 30))
             p = QPainter(thumb_img)
             p.setPen(QColor(235, 235, 235))
@@ -156,7 +328,14 @@ class DashboardOverlayClient:
             p.setFont(f)
             p.drawText(20, 130, "LLC")
             p.end()
-            self._set_raw(self.thumb, thumb_img)
+            self._thumb_img = thumb_img.convertToFormat(QImage.Format.Format_RGBA8888)
+        self._thumb_submitted = self._set_raw(self.thumb, self._thumb_img, bpl=256 * 4)
+
+    def _retry_due(self, handle) -> Optional[float]:
+        # Monotonic time of the pending quick RequestFailed retry for `handle`, or None if none is pending.
+        if not self._submit_retry_attempt.get(handle):
+            return None
+        return self._next_submit_time.get(handle, 0.0)
 
     def shutdown(self) -> None:
         try:
@@ -164,28 +343,34 @@ class DashboardOverlayClient:
                 self._coach.stop()
         except Exception:
             pass
+        self._heatmap_exec.shutdown(wait=False, cancel_futures=True)
+        self._state_stop.set()
+        if self._state_thread.is_alive():
+            self._state_thread.join(timeout=1.0)
         try:
             if self.overlay and self.handle is not None:
                 _safe_call(self.overlay, "DestroyOverlay", "destroyOverlay", self.handle)
         except Exception:
             pass
         try:
-            openvr.shutdown()
+            with _OPENVR_LOCK:
+                openvr.shutdown()
             self._openvr_inited = False
         except Exception:
             pass
+        if self._timer_resolution_set:
+            _set_timer_resolution(False)
+            self._timer_resolution_set = False
 
     def run(self, fps: float = 20.0) -> None:
         dt = 1.0 / max(1.0, fps)
+        # Sleep to an absolute deadline so oversleep/jitter does not compound into drift. Frame pacing uses
+        # perf_counter (high resolution everywhere); see _sleep_until.
+        next_deadline = time.perf_counter() + dt
         while True:
-            start = time.perf_counter()
-
-            # Avoid heavy per-frame logic: fetch state at a lower cadence and reuse between frames.
-            now_m = time.monotonic()
-            if now_m >= self._next_state_fetch_time:
-                self._cached_state = self._get_json("/state")
-                self._next_state_fetch_time = now_m + 0.2  # 5 Hz
-            state = self._cached_state
+            # State arrives at 5 Hz from the poller thread; frames in between reuse the latest reply.
+            with self._state_lock:
+                state = self._cached_state
 
             history_heatmap = self._maybe_update_history_heatmap(state)
             if self._coach is not None and self._coach.is_running():
@@ -194,40 +379,65 @@ class DashboardOverlayClient:
                 except Exception as e:
                     log.warning("VR Coach submit failed: %s: %s", type(e).__name__, e)
 
-            img = self._render(state)
-            self._set_raw(self.handle, img)
+            now_m = time.monotonic()
+            if now_m >= self._next_render_time:
+                self._next_render_time = now_m + self._render_period_s
+                img = self._render(state)
+                if self._render_gen != self._submitted_gen and self._set_raw(self.handle, img, bpl=self.w * 4):
+                    self._submitted_gen = self._render_gen
+                self._submit_thumb()
             self._pump_events()
             self._log_diagnostics_rate_limited()
-            time.sleep(max(0.0, dt - (time.perf_counter() - start)))
+
+            now = time.perf_counter()
+            if next_deadline > now:
+                _sleep_until(next_deadline)
+            next_deadline += dt
+            if next_deadline < now - dt:
+                # Fell more than a frame behind (stall, SteamVR hiccup): resync instead of bursting to catch up.
+                next_deadline = now + dt
 
     def _maybe_update_history_heatmap(self, state: Dict) -> Optional[Dict]:
         if not self.toggles.use_history:
             self._history_heatmap = None
             self._history_heatmap_key = None
+            self._pending_hm_future = None
+            self._pending_hm_key = None
             return None
 
+        fut = self._pending_hm_future
+        if fut is not None and fut.done():
+            self._pending_hm_future = None
+            try:
+                hm = fut.result()
+            except Exception as e:
+                log.warning("History heatmap compute failed: %s: %s", type(e).__name__, e)
+                hm = None
+            if hm is None:
+                self._history_heatmap = None
+            else:
+                self._history_heatmap = {"origin_m": list(hm.origin_m), "step_m": hm.step_m, "w": hm.w, "h": hm.h, "score": hm.score}
+            self._history_heatmap_key = self._pending_hm_key
+
         pa = state.get("play_area") or {}
         corners = pa.get("corners_m")
         if not (isinstance(corners, list) and len(corners) >= 4):
             return None
 
-        key = ("history", tuple((float(c[0]), float(c[1])) for c in corners), 0.25)
-        if key == self._history_heatmap_key and self._history_heatmap is not None:
+        # Quantize corners to 1 cm so tracking-level float jitter in the play area does not trigger recomputes.
+        key = ("history", tuple((round(float(c[0]), 2), round(float(c[1]), 2)) for c in corners), 0.25)
+        if key == self._history_heatmap_key:
             return self._history_heatmap
 
-        play_area = PlayArea(
-            corners_m=[(float(c[0]), float(c[1])) for c in corners],
-            source=str(pa.get("source") or "unknown"),
-            warning=str(pa.get("warning") or "") or None,
-        )
-        hm = self._logs.compute_heatmap(play_area, step_m=0.25)
-        if hm is None:
-            self._history_heatmap = None
-            self._history_heatmap_key = key
-            return None
-
-        self._history_heatmap = {"origin_m": list(hm.origin_m), "step_m": hm.step_m, "w": hm.w, "h": hm.h, "score": hm.score}
-        self._history_heatmap_key = key
+        # Keep showing the previous heatmap until the recompute for the new play area lands.
+        if self._pending_hm_future is None:
+            play_area = PlayArea(
+                corners_m=[(float(c[0]), float(c[1])) for c in corners],
+                source=str(pa.get("source") or "unknown"),
+                warning=str(pa.get("warning") or "") or None,
+            )
+            self._pending_hm_key = key
+            self._pending_hm_future = self._heatmap_exec.submit(self._logs.compute_heatmap, play_area, 0.25)
         return self._history_heatmap
 
     def _create_or_recreate_overlay(self) -> None:
@@ -239,6 +449,13 @@ class DashboardOverlayClient:
                 _safe_call(self.overlay, "DestroyOverlay", "destroyOverlay", self.handle)
             except Exception:
                 pass
+        # A new overlay starts with no texture; make the run loop submit the current panel and thumbnail again.
+        self._submitted_gen = -1
+        self._thumb_submitted = False
+        self._submitted_crc.clear()
+        self._next_submit_time.clear()
+        self._submit_retry_attempt.clear()
+        self._consecutive_failures.clear()
 
         try:
             res = _safe_call(
@@ -299,15 +516,16 @@ class DashboardOverlayClient:
             self.thumb = None
 
     def _find_overlay_handle(self, key: str):
-        if self.overlay is None:
+        find = self._find_overlay_fn
+        if self.overlay is None or find is None:
             return None
-        fn = "findOverlay" if hasattr(self.overlay, "findOverlay") else "FindOverlay"
         try:
-            res = getattr(self.overlay, fn)(key)
+            with _OPENVR_LOCK:
+                res = find(key)
         except getattr(openvr.error_code, "OverlayError_UnknownOverlay", Exception):
             return None
         except Exception as e:
-            log.debug("OpenVR call failed: %s -> %s: %s", fn, type(e).__name__, e)
+            log.debug("OpenVR call failed: %s -> %s: %s", find.__name__, type(e).__name__, e)
             return None
 
         handle = None
@@ -407,35 +625,76 @@ class DashboardOverlayClient:
             return False
 
     def _is_valid_handle(self, handle) -> bool:
+        if type(handle) is int:
+            return handle != 0 and handle != _INVALID_OVERLAY_HANDLE
         if handle is None:
             return False
         try:
             h = int(handle)
         except Exception:
             return False
-        if h == 0:
-            return False
-        invalid = getattr(openvr, "k_ulOverlayHandleInvalid", None)
-        if invalid is not None:
+        return h != 0 and h != _INVALID_OVERLAY_HANDLE
+
+    def _state_poll_loop(self) -> None:
+        # One request in flight at a time; a slow reply only delays the next poll.
+        period = 0.2  # 5 Hz
+        # start() made the first fetch synchronously.
+        next_fetch = time.monotonic() + period
+        self._state_stop.wait(period)
+        while not self._state_stop.is_set():
+            state = self._get_json("/state")
+            with self._state_lock:
+                self._cached_state = state
+            next_fetch += period
+            now = time.monotonic()
+            if next_fetch < now:
+                next_fetch = now
+            self._state_stop.wait(next_fetch - now)
+
+    def _http(
+        self, method: str, path: str, body: Optional[bytes] = None, headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[http.client.HTTPResponse, bytes]:
+        for _ in range(2):
+            conn = getattr(self._http_local, "conn", None)
+            reused = conn is not None
+            if conn is None:
+                conn = self._http_conn_cls(self._http_host, self._http_port, timeout=0.35)
+                self._http_local.conn = conn
             try:
-                if h == int(invalid):
-                    return False
-            except Exception:
-                pass
-        return True
+                conn.request(method, self._http_prefix + path, body=body, headers=headers or {})
+                r = conn.getresponse()
+                data = r.read()
+            except Exception as e:
+                conn.close()
+                self._http_local.conn = None
+                # The server may drop an idle keep-alive connection; retry once on a fresh one.
+                if reused and isinstance(e, (ConnectionResetError, BrokenPipeError)):
+                    continue
+                raise
+            if r.status >= 400:
+                raise http.client.HTTPException(f"{method} {path} -> HTTP {r.status}")
+            return r, data
+        raise http.client.HTTPException(f"{method} {path}: connection dropped")
 
     def _get_json(self, path: str) -> Dict:
         try:
-            with urllib.request.urlopen(self.state_url + path, timeout=0.35) as r:
-                return json.loads(r.read().decode("utf-8"))
+            cached = self._json_cache.get(path)
+            r, raw = self._http("GET", path, headers={"If-None-Match": cached[0]} if cached else None)
+            if r.status == 304 and cached is not None:
+                return cached[1]
+            obj = _json_loads(raw)
+            etag = r.getheader("ETag")
+            if etag:
+                self._json_cache[path] = (etag, obj)
+            else:
+                self._json_cache.pop(path, None)
+            return obj
         except Exception:
             return {"connected": False, "last_error": "State server unreachable", "stations": [], "trackers": [], "coverage": None, "recommendations": [], "diagnostic": {"running": False, "stage": "Idle"}}
 
     def _post(self, path: str) -> None:
         try:
-            req = urllib.request.Request(self.state_url + path, method="POST", data=b"{}")
-            with urllib.request.urlopen(req, timeout=0.35) as r:
-                r.read()
+            self._http("POST", path, b"{}")
         except Exception:
             pass
 
@@ -443,13 +702,10 @@ class DashboardOverlayClient:
         # Best-effort click support.
         if self._event_poll_broken:
             return
-        if self.overlay is None:
-            return
-
-        fn = "pollNextOverlayEvent" if hasattr(self.overlay, "pollNextOverlayEvent") else "PollNextOverlayEvent"
-        if not hasattr(self.overlay, fn):
+        poll = self._poll_event_fn
+        if self.overlay is None or poll is None:
             return
-        poll = getattr(self.overlay, fn)
+        fn = poll.__name__
 
         e = openvr.VREvent_t()
 
@@ -469,7 +725,8 @@ class DashboardOverlayClient:
                 return
             while True:
                 try:
-                    ok = poll(h, e)
+                    with _OPENVR_LOCK:
+                        ok = poll(h, e)
                 except TypeError as ex:
                     log.error(
                         "Overlay event polling disabled: %s signature mismatch (%s: %s)",
@@ -483,18 +740,23 @@ class DashboardOverlayClient:
                     log.error("OpenVR call failed: %s -> %s: %s", fn, type(ex).__name__, ex)
                     return
 
+                # Newer pyopenvr returns (result, event) rather than a bare bool.
+                if isinstance(ok, tuple):
+                    ok = ok[0]
                 if not ok:
                     break
 
                 self._events_polled_since += 1
+                et = int(e.eventType)
                 now = time.monotonic()
+                self._active_event_handle = handle_int
+                self._last_event_time = now
                 if now - self._events_last_rate_time >= 1.0:
                     log.info("overlay_events_polled_per_sec=%d", self._events_polled_since)
                     self._events_polled_since = 0
                     self._events_last_rate_time = now
 
                 if not self._logged_first_event_by_handle.get(handle_int):
-                    et = int(e.eventType)
                     name = _maybe_name_event(et)
                     try:
                         nx = float(e.data.mouse.x)
@@ -514,325 +776,387 @@ class DashboardOverlayClient:
                     self._logged_first_event_by_handle[handle_int] = True
                     self._logged_first_event = True
 
-                if int(e.eventType) == int(getattr(openvr, "VREvent_MouseMove", 300)):
+                if et == _EVENT_MOUSE_MOVE:
                     try:
                         nx = float(e.data.mouse.x)
                         ny = float(e.data.mouse.y)
                         px, py = self._mouse_coords_to_px(nx, ny)
+                        last = self._mouse_px
+                        if last is not None and abs(px - last[0]) < 1.0 and abs(py - last[1]) < 1.0:
+                            # Sub-pixel laser jitter: nothing visible changes, skip the hover hit-test.
+                            continue
                         self._mouse_px = (px, py)
                         if not self._logged_first_mouse_move:
                             log.info("overlay_first_mouse_move mouse_px=(%.1f,%.1f)", px, py)
                             self._logged_first_mouse_move = True
-                        hover = None
-                        for b in self.buttons:
-                            if b.hit(px, py):
-                                hover = b.id
-                                break
-                        self._hover_button_id = hover
+                        b = self._button_at(px, py)
+                        self._hover_button_id = b.id if b is not None else None
                     except Exception:
                         pass
 
-                if int(e.eventType) == int(getattr(openvr, "VREvent_MouseButtonDown", 200)):
+                if et == _EVENT_MOUSE_DOWN:
                     self._click_toggle = not self._click_toggle
                     self._click_count += 1
                     x, y = self._mouse_coords_to_px(float(e.data.mouse.x), float(e.data.mouse.y))
-                    for b in self.buttons:
-                        if b.hit(x, y):
-                            if b.id == "coach":
-                                if self._coach is None or not self._coach.is_running():
-                                    try:
-                                        self._coach = VRCoachOverlay(self.overlay, self.state_url, self.toggles)
-                                        self._coach.start()
-                                    except Exception as ex:
-                                        log.error("Failed to start VR Coach: %s: %s", type(ex).__name__, ex)
-                                else:
-                                    try:
-                                        self._coach.stop()
-                                    finally:
-                                        self._coach = None
-                            elif b.id == "history":
-                                self.toggles.use_history = not self.toggles.use_history
-                            elif b.id == "heatmap":
-                                self.toggles.heatmap = not self.toggles.heatmap
-                            elif b.id == "body":
-                                self.toggles.body_suggestions = not self.toggles.body_suggestions
-                            elif b.id == "diagnostic":
-                                self._post("/run_diagnostic")
-                            elif b.id == "recompute":
-                                self._post("/recompute")
+                    b = self._button_at(x, y)
+                    if b is not None:
+                        if b.id == "coach":
+                            if self._coach is None or not self._coach.is_running():
+                                try:
+                                    self._coach = VRCoachOverlay(
+                                        self.overlay, self.state_url, self.toggles, overlay_lock=_OPENVR_LOCK
+                                    )
+                                    self._coach.start()
+                                except Exception as ex:
+                                    log.error("Failed to start VR Coach: %s: %s", type(ex).__name__, ex)
+                            else:
+                                try:
+                                    self._coach.stop()
+                                finally:
+                                    self._coach = None
+                        elif b.id == "history":
+                            self.toggles.use_history = not self.toggles.use_history
+                        elif b.id == "heatmap":
+                            self.toggles.heatmap = not self.toggles.heatmap
+                        elif b.id == "body":
+                            self.toggles.body_suggestions = not self.toggles.body_suggestions
+                        elif b.id == "diagnostic":
+                            self._post("/run_diagnostic")
+                        elif b.id == "recompute":
+                            self._post("/recompute")
 
         try:
             # Some SteamVR configurations may deliver dashboard events to the thumbnail handle;
-            # poll both to avoid "non-interactable" issues.
-            _pump_for_handle(self.handle)
-            _pump_for_handle(self.thumb)
+            # poll both until one of them is observed delivering events to avoid "non-interactable" issues.
+            targets = [h for h in (self.handle, self.thumb) if self._is_valid_handle(h)]
+            active = self._active_event_handle
+            if active is not None:
+                if time.monotonic() - self._last_event_time > self._active_event_handle_timeout_s:
+                    self._active_event_handle = None
+                else:
+                    pinned = [h for h in targets if int(h) == active]
+                    if pinned:
+                        targets = pinned
+            for h in targets:
+                _pump_for_handle(h)
         except Exception:
             return
 
-    def _render(self, state: Dict) -> QImage:
-        img = QImage(self.w, self.h, QImage.Format.Format_RGBA8888)
-        img.fill(QColor(26, 40, 60) if self._click_toggle else QColor(18, 18, 18))
-        p = QPainter(img)
-        p.setRenderHint(QPainter.RenderHint.Antialiasing, True)
-
-        title = QFont("Segoe UI", 18)
-        title.setBold(True)
-        p.setFont(title)
-        p.setPen(QColor(235, 235, 235))
-        p.drawText(24, 40, "LighthouseLayoutCoach (Dashboard Panel)")
-        p.setFont(QFont("Segoe UI", 12))
-        p.setPen(QColor(190, 190, 190))
-        p.drawText(24, 62, f"Input proof: clicks={self._click_count}")
+    def _button_at(self, x: float, y: float) -> Optional[Button]:
+        for b in self._button_grid.get((int(x) >> 5, int(y) >> 5), ()):
+            if b.hit(x, y):
+                return b
+        return None
 
+    def _render(self, state: Dict) -> QImage:
         connected = bool(state.get("connected"))
-        p.setFont(QFont("Segoe UI", 12))
-        p.setPen(QColor(120, 220, 160) if connected else QColor(255, 170, 120))
-        p.drawText(24, 68, "SteamVR connected" if connected else f"Waiting for SteamVR… {state.get('last_error','')}")
-
         stations = state.get("stations") or []
         trackers = state.get("trackers") or []
         station_n = len(stations)
         tracker_n = len(trackers)
         ok_n = sum(1 for t in trackers if t.get("tracking_ok"))
+        diag = state.get("diagnostic") or {}
+        coach_running = self._coach is not None and self._coach.is_running()
+        hist = self._logs.summary()
+        mouse = self._mouse_px
+        key = (
+            connected,
+            None if connected else state.get("last_error", ""),
+            station_n,
+            tracker_n,
+            ok_n,
+            diag.get("stage", "Idle"),
+            bool(diag.get("running")),
+            coach_running,
+            self.toggles.use_history,
+            self.toggles.heatmap,
+            self.toggles.body_suggestions,
+            hist.sessions,
+            hist.points,
+            self._click_toggle,
+            self._click_count,
+            self._hover_button_id,
+            None if mouse is None else (int(mouse[0]), int(mouse[1])),
+        )
+        if key == self._render_key:
+            return self._frame_out
+        img = self._frame_img
+
+        p = QPainter(img)
+        p.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        p.drawImage(0, 0, self._base_image(self._click_toggle))
+        p.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+
+        p.setFont(self._font_body)
+        p.setPen(self._color_caption)
+        p.drawText(24, 62, f"Input proof: clicks={self._click_count}")
 
-        y = 115
-        p.setFont(QFont("Segoe UI", 13, weight=QFont.Weight.DemiBold))
-        p.setPen(QColor(220, 220, 220))
-        p.drawText(24, y, "Summary")
-        y += 24
-        p.setFont(QFont("Consolas", 11))
-        p.setPen(QColor(200, 200, 200))
+        p.setPen(self._color_ok if connected else self._color_warn)
+        p.drawText(24, 68, "SteamVR connected" if connected else f"Waiting for SteamVR… {state.get('last_error','')}")
+
+        y = 139
+        p.setFont(self._font_mono)
+        p.setPen(self._color_text)
         p.drawText(24, y, f"Base stations: {station_n} | Trackers: {tracker_n} (OK: {ok_n})")
         y += 18
-        diag = state.get("diagnostic") or {}
         p.drawText(24, y, f"Diagnostic: {diag.get('stage','Idle')} {'(running)' if diag.get('running') else ''}")
         y += 18
-        p.drawText(24, y, f"VR Coach: {'Running' if (self._coach is not None and self._coach.is_running()) else 'Stopped'}")
+        p.drawText(24, y, f"VR Coach: {'Running' if coach_running else 'Stopped'}")
         y += 18
-        hist = self._logs.summary()
         p.drawText(
             24,
             y,
             f"Historical logs: {'ON' if self.toggles.use_history else 'OFF'} | sessions {hist.sessions} | points {hist.points}",
         )
 
-        # Update button labels based on current toggles/state.
-        for i, b in enumerate(self.buttons):
-            if b.id == "coach":
-                label = "Exit VR Coach" if (self._coach is not None and self._coach.is_running()) else "Launch VR Coach"
-                self.buttons[i] = Button(b.id, b.rect, label)
-            elif b.id == "history":
-                self.buttons[i] = Button(b.id, b.rect, f"History: {'ON' if self.toggles.use_history else 'OFF'}")
-            elif b.id == "heatmap":
-                self.buttons[i] = Button(b.id, b.rect, f"Heatmap: {'ON' if self.toggles.heatmap else 'OFF'}")
-            elif b.id == "body":
-                self.buttons[i] = Button(b.id, b.rect, f"Body: {'ON' if self.toggles.body_suggestions else 'OFF'}")
-
-        p.setFont(QFont("Segoe UI", 10, weight=QFont.Weight.DemiBold))
+        # Idle button chrome and static labels come from the base image; draw only the hovered button and live labels.
+        p.setFont(self._font_button)
         for b in self.buttons:
-            x, by, bw, bh = b.rect
-            p.setPen(QPen(QColor(90, 90, 90), 2))
-            is_hover = (self._hover_button_id == b.id)
-            p.setBrush(QColor(48, 48, 48) if is_hover else QColor(30, 30, 30))
-            p.drawRoundedRect(x, by, bw, bh, 8, 8)
-            p.setPen(QColor(230, 230, 230))
-            p.drawText(x + 14, by + 36, b.label)
+            hovered = self._hover_button_id == b.id
+            if hovered:
+                x, by, bw, bh = b.rect
+                # Clear the idle chrome first so the antialiased border is not blended twice.
+                p.fillRect(x - 2, by - 2, bw + 4, bh + 4, self._color_bg_clicked if self._click_toggle else self._color_bg)
+                p.setPen(self._pen_border)
+                p.setBrush(self._color_button_hover)
+                p.drawRoundedRect(x, by, bw, bh, 8, 8)
+            if hovered or b.id in _TOGGLE_BUTTON_IDS:
+                p.setPen(self._color_button_text)
+                self._draw_label(p, b.rect[0] + 14, b.rect[1] + 36, self._button_label(b, coach_running))
 
         # Cursor hint for interaction debugging.
         if self._mouse_px is not None:
             try:
                 mx, my = self._mouse_px
                 p.setPen(Qt.PenStyle.NoPen)
-                p.setBrush(QColor(255, 255, 255, 140))
+                p.setBrush(self._color_cursor)
                 p.drawEllipse(int(mx) - 4, int(my) - 4, 8, 8)
             except Exception:
                 pass
 
         p.end()
-        return img
-
-    def _draw_heatmap(self, p: QPainter, heat: Dict, key: str, x0: int, y0: int, w: int, h: int) -> None:
-        try:
-            gw = int(heat["w"])
-            gh = int(heat["h"])
-            vals = heat[key]
-            cell_w = w / max(1, gw)
-            cell_h = h / max(1, gh)
-            for yi in range(gh):
-                for xi in range(gw):
-                    v = int(vals[yi * gw + xi])
-                    if v < 0:
-                        continue
-                    if v == 0:
-                        c = QColor(200, 60, 60, 110)
-                    elif v == 1:
-                        c = QColor(210, 170, 60, 110)
-                    else:
-                        c = QColor(60, 200, 110, 120)
-                    p.fillRect(int(x0 + xi * cell_w), int(y0 + yi * cell_h), int(cell_w + 1), int(cell_h + 1), c)
-            p.setPen(QPen(QColor(90, 90, 90), 2))
-            p.setBrush(Qt.BrushStyle.NoBrush)
-            p.drawRect(x0, y0, w, h)
-        except Exception:
-            return
-
-    def _draw_minimap(self, p: QPainter, state: Dict, x0: int, y0: int, w: int, h: int) -> None:
-        # Draw play area polygon, station arrows, and tracker points (top-down).
-        pa = (state.get("play_area") or {})
-        corners = pa.get("corners_m") or None
-        if not corners:
-            p.setPen(QColor(120, 120, 120))
-            p.drawText(x0, y0 + 18, "Play area unavailable")
-            p.setPen(QPen(QColor(90, 90, 90), 2))
-            p.drawRect(x0, y0, w, h)
-            return
-
-        pts = [(float(c[0]), float(c[1])) for c in corners]
-        xs = [x for x, _ in pts]
-        ys = [y for _, y in pts]
-        min_x, max_x = min(xs), max(xs)
-        min_y, max_y = min(ys), max(ys)
-        pad = 0.15
-        min_x -= pad
-        max_x += pad
-        min_y -= pad
-        max_y += pad
-        sx = w / max(1e-6, (max_x - min_x))
-        sy = h / max(1e-6, (max_y - min_y))
-        s = min(sx, sy)
-
-        def to_px(xm: float, ym: float) -> Tuple[float, float]:
-            px = x0 + (xm - min_x) * s
-            py = y0 + h - (ym - min_y) * s
-            return px, py
-
-        # Background + border
-        p.fillRect(x0, y0, w, h, QColor(22, 22, 22))
-        p.setPen(QPen(QColor(90, 90, 90), 2))
-        p.setBrush(Qt.BrushStyle.NoBrush)
-        p.drawRect(x0, y0, w, h)
-
-        # Play area outline
-        p.setPen(QPen(QColor(200, 200, 200), 2))
-        for i in range(len(pts)):
-            a = pts[i]
-            b = pts[(i + 1) % len(pts)]
-            ax, ay = to_px(a[0], a[1])
-            bx, by = to_px(b[0], b[1])
-            p.drawLine(int(ax), int(ay), int(bx), int(by))
-
-        # Stations
-        for st in state.get("stations", [])[:2]:
-            pos = st.get("pos_m") or [0, 0, 0]
-            yaw = float(st.get("yaw_deg", 0.0))
-            px, py = to_px(float(pos[0]), float(pos[1]))
-            p.setPen(Qt.PenStyle.NoPen)
-            p.setBrush(QColor(120, 180, 255))
-            p.drawEllipse(int(px - 5), int(py - 5), 10, 10)
-            # arrow
-            dx = math.cos(math.radians(yaw))
-            dy = math.sin(math.radians(yaw))
-            ex, ey = to_px(float(pos[0]) + dx * 0.5, float(pos[1]) + dy * 0.5)
-            p.setPen(QPen(QColor(120, 180, 255), 2))
-            p.drawLine(int(px), int(py), int(ex), int(ey))
-
-        # Trackers
-        for tr in state.get("trackers", []):
-            pos = tr.get("pos_m")
-            if not pos:
-                continue
-            px, py = to_px(float(pos[0]), float(pos[1]))
-            ok = bool(tr.get("tracking_ok"))
-            p.setPen(Qt.PenStyle.NoPen)
-            p.setBrush(QColor(120, 255, 170) if ok else QColor(255, 170, 120))
-            p.drawEllipse(int(px - 4), int(py - 4), 8, 8)
-
-    def _set_raw(self, handle, img: QImage) -> None:
-        if img.format() != QImage.Format.Format_RGBA8888:
-            img = img.convertToFormat(QImage.Format.Format_RGBA8888)
+        self._frame_out = img.convertToFormat(QImage.Format.Format_RGBA8888)
+        self._render_key = key
+        self._render_gen += 1
+        return self._frame_out
+
+    def _base_image(self, clicked: bool) -> QImage:
+        base = self._base_imgs.get(clicked)
+        if base is not None:
+            return base
+        base = QImage(self.w, self.h, QImage.Format.Format_ARGB32_Premultiplied)
+        base.fill(self._color_bg_clicked if clicked else self._color_bg)
+        p = QPainter(base)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        p.setFont(self._font_title)
+        p.setPen(self._color_title)
+        p.drawText(24, 40, "LighthouseLayoutCoach (Dashboard Panel)")
+        p.setFont(self._font_heading)
+        p.setPen(self._color_heading)
+        p.drawText(24, 115, "Summary")
+        p.setFont(self._font_button)
+        for b in self.buttons:
+            x, by, bw, bh = b.rect
+            p.setPen(self._pen_border)
+            p.setBrush(self._color_button)
+            p.drawRoundedRect(x, by, bw, bh, 8, 8)
+            if b.id not in _TOGGLE_BUTTON_IDS:
+                p.setPen(self._color_button_text)
+                p.drawText(x + 14, by + 36, b.label)
+        p.end()
+        self._base_imgs[clicked] = base
+        return base
+
+    def _draw_label(self, p: QPainter, x: int, baseline_y: int, text: str) -> None:
+        st = self._label_texts.get(text)
+        if st is None:
+            st = QStaticText(text)
+            st.prepare(font=self._font_button)
+            self._label_texts[text] = st
+        if self._label_ascent is None:
+            self._label_ascent = QFontMetrics(self._font_button).ascent()
+        # drawStaticText positions by the top-left corner, drawText by the baseline.
+        p.drawStaticText(x, baseline_y - self._label_ascent, st)
+
+    def _button_label(self, b: Button, coach_running: bool) -> str:
+        # Toggle buttons show live state; the rest keep their static label.
+        if b.id == "coach":
+            return "Exit VR Coach" if coach_running else "Launch VR Coach"
+        if b.id == "history":
+            return f"History: {'ON' if self.toggles.use_history else 'OFF'}"
+        if b.id == "heatmap":
+            return f"Heatmap: {'ON' if self.toggles.heatmap else 'OFF'}"
+        if b.id == "body":
+            return f"Body: {'ON' if self.toggles.body_suggestions else 'OFF'}"
+        return b.label
+
+    def _submit_buffer(self, w: int, h: int, depth: int) -> ctypes.Array:
+        # Persistent staging buffers for images that cannot be submitted in place, keyed by frame shape so the
+        # dashboard and thumbnail sizes don't evict each other; anything older is dropped to bound memory.
+        key = (w, h, depth)
+        buf = self._submit_bufs.get(key)
+        if buf is None:
+            if len(self._submit_bufs) >= 2:
+                self._submit_bufs.pop(next(iter(self._submit_bufs)))
+            buf = _ubyte_array(w * h * depth)()
+            self._submit_bufs[key] = buf
+        return buf
+
+    def _frame_buffer(
+        self, img: QImage, w: int, h: int, depth: int, bpl: Optional[int]
+    ) -> Tuple[QImage, Optional[ctypes.Array]]:
+        """
+        Return (image, ctypes buffer of exactly w*h*depth bytes) for SetOverlayRaw, or (image, None) if the image
+        memory is too small. The returned image backs the buffer and must stay referenced until the call completes.
 
-        w = int(img.width())
-        h = int(img.height())
-        depth = 4
+        Read-only paths use constBits() so a shared QImage is never detached just to be copied. The in-place view
+        needs bits(): ctypes can only wrap a writable buffer, and for the unshared images rendered here that call
+        does not copy.
+        """
         expected_len = w * h * depth
-
-        data = img.bits().tobytes()
-        if not isinstance(data, (bytes, bytearray)):
-            log.error("SetOverlayRaw skipped: buffer type is %s (expected bytes/bytearray)", type(data).__name__)
-            return
-
-        if len(data) != expected_len:
-            # QImage can include scanline padding; strip to w*depth per row when needed.
+        row_len = w * depth
+        if bpl is None:
             bpl = int(img.bytesPerLine())
-            row_len = w * depth
-            if bpl >= row_len and h > 0:
-                data = b"".join(data[y * bpl : y * bpl + row_len] for y in range(h))
+        if bpl > row_len:
+            # Scanline padding (only seen on QImages wrapping an external buffer): QImage.copy() repacks rows
+            # to the default w*4 stride with a native per-scanline memcpy, so the in-place path below applies.
+            img = img.copy()
+            bpl = int(img.bytesPerLine())
+        if bpl == row_len and h > 0:
+            # Tightly packed rows: hand OpenVR a ctypes view over the QImage's own pixels (no bytes/ctypes copies).
+            # This must stay a ctypes array rather than a c_void_p: pyopenvr passes byref(buffer), which would
+            # otherwise point at the pointer.
+            try:
+                return img, _ubyte_array(expected_len).from_buffer(img.bits())
+            except (TypeError, ValueError):
+                pass
 
-        if len(data) != expected_len:
+        src = img.constBits()
+        if bpl != row_len or len(src) < expected_len:
             log.error(
                 "SetOverlayRaw skipped: buffer length mismatch (got=%d expected=%d w=%d h=%d depth=%d)",
-                len(data),
+                len(src),
                 expected_len,
                 w,
                 h,
                 depth,
             )
-            return
-
+            return img, None
+        # Only reached when ctypes cannot wrap the pixels in place; rows are always packed here (padded images were
+        # repacked by copy() above), so this is a single memcpy into the pooled staging buffer.
+        buf = self._submit_buffer(w, h, depth)
+        memoryview(buf).cast("B")[:] = src[:expected_len]
+        return img, buf
+
+    def _preflight(self, handle, now: float) -> Tuple[bool, object]:
+        """
+        Gate a SetOverlayRaw submission. Returns (ok, handle to submit to); the handle may be replaced when an
+        invalid one triggers a (cooldown-limited) overlay recreate.
+        """
         if not self._openvr_inited:
             log.error("SetOverlayRaw skipped: OpenVR not initialized")
-            return
+            return False, handle
         if self.overlay is None:
             log.error("SetOverlayRaw skipped: overlay interface is None")
-            return
+            return False, handle
         if not self._is_valid_handle(handle):
             # Do not spam recreates; rate-limit with cooldown.
             if self._recreate_if_allowed(f"invalid overlay handle {handle!r}"):
                 handle = self.handle
             if not self._is_valid_handle(handle):
-                return
-
+                return False, handle
+        if now < self._next_submit_time.get(handle, 0.0):
+            return False, handle
+        return True, handle
+
+    def _submit_raw(self, handle, buf: ctypes.Array, w: int, h: int, depth: int) -> None:
+        # Same logging contract as _safe_call, through the SetOverlayRaw method bound in start().
+        fn = self._set_overlay_raw_fn
+        if fn is None:
+            fn = self._set_overlay_raw_fn = _bind_method(self.overlay, "SetOverlayRaw", "setOverlayRaw")
+        try:
+            with _OPENVR_LOCK:
+                fn(handle, buf, w, h, depth)
+        except Exception as e:
+            log.error("OpenVR call failed: %s -> %s: %s", fn.__name__, type(e).__name__, e)
+            raise
+
+    def _set_raw(self, handle, img: QImage, *, bpl: Optional[int] = None) -> bool:
+        # Returns True only when OpenVR accepted the frame.
+        # `bpl` lets callers that allocated the RGBA8888 image themselves pass its known row stride (w*4)
+        # and skip the bytesPerLine() query.
+        # One clock sample per call; only a successful submit re-reads it for the post-submit timestamp.
         now = time.monotonic()
-        if now < self._next_submit_time:
-            return
+        # Gate first: throttled/skipped submissions must not pay for format conversion or staging copies.
+        ok, handle = self._preflight(handle, now)
+        if not ok:
+            return False
 
-        log.debug("SetOverlayRaw: handle=%s w=%d h=%d depth=%d len=%d", handle, w, h, depth, len(data))
-        buf = ctypes.create_string_buffer(data, len(data))
+        # Every caller builds its frame as RGBA8888 (the layout OpenVR reads); reject anything else instead of
+        # silently paying for a full-frame convertToFormat.
+        if img.format() != QImage.Format.Format_RGBA8888:
+            log.error("SetOverlayRaw skipped: expected RGBA8888 image, got %s", img.format())
+            return False
+
+        w = int(img.width())
+        h = int(img.height())
+        depth = 4
+        img, buf = self._frame_buffer(img, w, h, depth, bpl)
+        if buf is None:
+            return False
+        nbytes = w * h * depth
+
+        # A full-frame CRC costs ~1 ms; resending an unchanged 3 MB texture costs a copy plus a GPU upload.
+        fingerprint = (w, h, zlib.crc32(buf))
+        if self._submitted_crc.get(handle) == fingerprint:
+            return True
+
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("SetOverlayRaw: handle=%s w=%d h=%d depth=%d len=%d", handle, w, h, depth, nbytes)
 
-        last_exc: Optional[Exception] = None
         self.submission_attempts += 1
-        for attempt in range(1, 4):
-            try:
-                _safe_call(self.overlay, "SetOverlayRaw", "setOverlayRaw", handle, buf, w, h, depth)
-                self.last_error = None
-                self._last_submit_ok_time = time.monotonic()
-                return
-            except openvr.error_code.OverlayError_RequestFailed as e:
-                last_exc = e
-                self.submission_failures += 1
-                self.last_error = f"{type(e).__name__}: {e}"
-                log.warning("SetOverlayRaw RequestFailed (attempt %d/3); retrying…", attempt)
-                time.sleep(0.05 * attempt)
-            except openvr.error_code.OverlayError_InvalidHandle as e:
-                last_exc = e
-                self.submission_failures += 1
-                self.last_error = f"{type(e).__name__}: {e}"
-                # Treat as a hard lifecycle failure (SteamVR restarted / overlay torn down).
-                self._next_submit_time = time.monotonic() + 2.0
-                if self._recreate_if_allowed("OverlayError_InvalidHandle during SetOverlayRaw"):
-                    handle = self.handle
-                return
-            except Exception as e:
-                last_exc = e
-                self.submission_failures += 1
-                self.last_error = f"{type(e).__name__}: {e}"
-                log.error("SetOverlayRaw failed: %s: %s", type(e).__name__, e)
-                return
+        try:
+            self._submit_raw(handle, buf, w, h, depth)
+            self.last_error = None
+            self._last_submit_ok_time = time.monotonic()
+            self._submit_retry_attempt.pop(handle, None)
+            self._consecutive_failures.pop(handle, None)
+            self._submitted_crc[handle] = fingerprint
+            return True
+        except _ERR_REQUEST_FAILED as e:
+            last_exc: Optional[Exception] = e
+            self.submission_failures += 1
+            self.last_error = f"{type(e).__name__}: {e}"
+            attempt = self._submit_retry_attempt.get(handle, 0) + 1
+            if attempt < 3:
+                # Retry on a later frame instead of sleeping in the overlay thread; the next call submits the newest frame.
+                self._submit_retry_attempt[handle] = attempt
+                retry_s = min(0.5, 0.05 * (2 ** attempt))
+                self._next_submit_time[handle] = now + retry_s
+                log.warning("SetOverlayRaw RequestFailed (attempt %d/3); retrying in %.2fs…", attempt, retry_s)
+                return False
+            self._submit_retry_attempt.pop(handle, None)
+        except _ERR_INVALID_HANDLE as e:
+            self.submission_failures += 1
+            self.last_error = f"{type(e).__name__}: {e}"
+            self._submit_retry_attempt.pop(handle, None)
+            # Treat as a hard lifecycle failure (SteamVR restarted / overlay torn down).
+            self._next_submit_time[handle] = now + 2.0
+            self._recreate_if_allowed("OverlayError_InvalidHandle during SetOverlayRaw")
+            return False
+        except Exception as e:
+            self.submission_failures += 1
+            self.last_error = f"{type(e).__name__}: {e}"
+            self._submit_retry_attempt.pop(handle, None)
+            log.error("SetOverlayRaw failed: %s: %s", type(e).__name__, e)
+            return False
 
-        # Back off 2-5 seconds on RequestFailed; do not recreate spam or cause flicker.
-        backoff_s = float(random.choice([2.0, 3.0, 5.0]))
-        self._next_submit_time = time.monotonic() + backoff_s
-        now = time.monotonic()
+        # Back off exponentially (1, 2, 4, then 5 s cap) on RequestFailed; do not recreate spam or cause flicker.
+        # A little jitter keeps retries from phase-locking with whatever is starving the compositor.
+        failures = self._consecutive_failures[handle] = self._consecutive_failures.get(handle, 0) + 1
+        backoff_s = min(5.0, 0.5 * (2 ** failures)) + random.uniform(0.0, 0.25)
+        self._next_submit_time[handle] = now + backoff_s
         if now - self._last_error_log_time >= 2.0:
             self._last_error_log_time = now
             log.warning(
@@ -841,22 +1165,25 @@ class DashboardOverlayClient:
                 w,
                 h,
                 depth,
-                len(data),
+                nbytes,
             )
 
         # If failures persist, allow a recreate only on cooldown and only after a sustained outage
         # (avoid flicker from recreate spam).
         last_ok = self._last_submit_ok_time
-        sustained_outage = (last_ok is None) or ((time.monotonic() - last_ok) > 10.0)
+        sustained_outage = (last_ok is None) or ((now - last_ok) > 10.0)
+        # Only a dashboard frame may be resent to the recreated dashboard handle; a thumbnail is re-driven by run().
+        was_dashboard = handle == self.handle
         if sustained_outage and self._recreate_if_allowed(
-            f"OverlayError_RequestFailed after retries ({w=} {h=} {depth=} len={len(data)})"
+            f"OverlayError_RequestFailed after retries ({w=} {h=} {depth=} len={nbytes})"
         ):
             try:
-                if self.overlay is not None and self._is_valid_handle(self.handle):
-                    _safe_call(self.overlay, "SetOverlayRaw", "setOverlayRaw", self.handle, buf, w, h, depth)
+                if was_dashboard and self.overlay is not None and self._is_valid_handle(self.handle):
+                    self._submit_raw(self.handle, buf, w, h, depth)
                     self.last_error = None
                     self._last_submit_ok_time = time.monotonic()
-                    return
+                    self._submitted_crc[self.handle] = fingerprint
+                    return True
             except Exception as e:
                 last_exc = e
 
@@ -865,10 +1192,25 @@ class DashboardOverlayClient:
             w,
             h,
             depth,
-            len(data),
+            nbytes,
             type(last_exc).__name__,
             last_exc,
         )
+        return False
+
+
+def _paint_overlay_test_image() -> QImage:
+    # Paint in QPainter's native format, then convert once to the RGBA8888 layout OpenVR expects.
+    test = QImage(256, 256, QImage.Format.Format_ARGB32_Premultiplied)
+    test.fill(QColor(30, 30, 30, 255))
+    p = QPainter(test)
+    p.setPen(QColor(235, 235, 235, 255))
+    f = QFont("Segoe UI", 26)
+    f.setBold(True)
+    p.setFont(f)
+    p.drawText(24, 140, "Overlay Test")
+    p.end()
+    return test.convertToFormat(QImage.Format.Format_RGBA8888)
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -884,6 +1226,12 @@ def main(argv: list[str] | None = None) -> int:
     log.info("Overlay logging to %s", log_path)
 
     app = QGuiApplication([])
+    test_future: Optional[Future] = None
+    if args.overlay_test:
+        # Paint the test frame while OpenVR initializes; start() can spend seconds retrying init.
+        pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="llc-overlay-test")
+        test_future = pool.submit(_paint_overlay_test_image)
+        pool.shutdown(wait=False)
     client = DashboardOverlayClient(args.url)
     try:
         client.start()
@@ -898,16 +1246,14 @@ def main(argv: list[str] | None = None) -> int:
         return 2
     try:
         if args.overlay_test:
-            test = QImage(256, 256, QImage.Format.Format_RGBA8888)
-            test.fill(QColor(30, 30, 30, 255))
-            p = QPainter(test)
-            p.setPen(QColor(235, 235, 235, 255))
-            f = QFont("Segoe UI", 26)
-            f.setBold(True)
-            p.setFont(f)
-            p.drawText(24, 140, "Overlay Test")
-            p.end()
-            client._set_raw(client.handle, test)
+            test = test_future.result()
+            client._set_raw(client.handle, test, bpl=256 * 4)
+            # RequestFailed retries are deferred rather than slept inside _set_raw; drive them here for the one-shot test.
+            due = client._retry_due(client.handle)
+            while due is not None:
+                time.sleep(max(0.0, due - time.monotonic()))
+                client._set_raw(client.handle, test, bpl=256 * 4)
+                due = client._retry_due(client.handle)
             return 0
 
         client.run(args.fps)
@@ -3,24 +3,37 @@ from __future__ import annotations
 import ctypes
 import logging
 import math
+import threading
 import time
 from dataclasses import dataclass
 from typing import Dict, Optional, Tuple
 
 import openvr
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QColor, QFont, QImage, QPainter, QPen
+from PySide6.QtCore import QLine, QPoint, QRectF, Qt
+from PySide6.QtGui import QColor, QFont, QImage, QPainter, QPen, QPolygon
 
 log = logging.getLogger("llc.vr_coach")
 
 Point2 = Tuple[float, float]
 
+# Heatmap cell pixels (RGBA8888, alpha 90) indexed by the 0..100 normalized score; the ramp saturates at 128.
+_HEAT_PIXELS = tuple(bytes((max(0, 255 - vv * 2), min(255, vv * 2), 80, 90)) for vv in range(129))
+_HEAT_EMPTY = bytes(4)
+
 
 def _safe_call(obj, pascal: str, camel: str, *args, **kwargs):
     fn = camel if hasattr(obj, camel) else pascal
     return getattr(obj, fn)(*args, **kwargs)
 
 
+def _bind_method(obj, pascal: str, camel: str):
+    # Per-frame calls are resolved once in start(); _safe_call stays for the one-shot setup/teardown calls.
+    fn = getattr(obj, camel, None)
+    if fn is None:
+        fn = getattr(obj, pascal, None)
+    return fn
+
+
 def _mat34_translate(x: float, y: float, z: float):
     # Identity rotation + translation in OpenVR HmdMatrix34_t form.
     m = openvr.HmdMatrix34_t()
@@ -54,16 +67,68 @@ class VRCoachOverlay:
     and place it in the standing universe. This keeps the implementation incremental and avoids engine rewrites.
     """
 
-    def __init__(self, overlay, state_url: str, toggles: VRCoachToggles) -> None:
+    def __init__(
+        self,
+        overlay,
+        state_url: str,
+        toggles: VRCoachToggles,
+        overlay_lock: Optional[threading.RLock] = None,
+    ) -> None:
         self.overlay = overlay
+        # IVROverlay is shared with the dashboard's main thread, and the render worker uploads concurrently with it;
+        # calls that can overlap the worker are made under this lock, so pass the owner's lock when sharing.
+        self._overlay_lock = overlay_lock if overlay_lock is not None else threading.RLock()
         self.state_url = state_url.rstrip("/")
         self.toggles = toggles
 
         self.handle = None
         self._visible = False
+        self._set_overlay_raw_fn = None
+        self._is_overlay_visible_fn = None
 
         self.w, self.h = 1024, 768
         self._last_submit = 0.0
+        # Rendering and upload run on a worker thread; submit_frame only posts the newest inputs into a one-deep
+        # slot (an unrendered frame is simply replaced), so the caller's loop never waits on the rasterizer.
+        self._pending: Optional[Tuple[Dict, Optional[Dict], float]] = None
+        self._pending_lock = threading.Lock()
+        self._render_wake = threading.Event()
+        self._render_stop = threading.Event()
+        self._render_thread: Optional[threading.Thread] = None
+        # IsOverlayVisible result, refreshed at most every 0.2 s (each check is an IPC round trip to vrcompositor).
+        # It only reflects this app's own Show/HideOverlay, and the coach is shown for its whole start()..stop()
+        # lifetime, so today this never skips a frame; it is a guard for a future path that hides without stopping.
+        self._composited = True
+        self._composited_checked_at = 0.0
+        # One frame image for the overlay's lifetime, plus a ctypes view over its pixels for SetOverlayRaw
+        # (OpenVR copies the texture during the call, so the same memory is repainted and resubmitted every frame).
+        self._frame_img = QImage(self.w, self.h, QImage.Format.Format_RGBA8888)
+        self._frame_buf = (ctypes.c_ubyte * (self.w * self.h * 4)).from_buffer(self._frame_img.bits())
+        self._frame_key: Optional[Tuple] = None
+        # (vals, has_score, cell image): the heatmap only changes with the 5 Hz state or a history recompute.
+        self._heat_cells: Optional[Tuple[object, bool, QImage]] = None
+        self._yaw_dir_cache: Dict[int, Tuple[float, float]] = {}
+
+        # Paint resources, built once instead of on every frame.
+        self._font_title = QFont("Segoe UI", 16)
+        self._font_title.setBold(True)
+        self._font_caption = QFont("Segoe UI", 11)
+        self._font_anchor = QFont("Segoe UI", 10)
+        self._pen_border = QPen(QColor(90, 90, 90), 2)
+        self._pen_outline = QPen(QColor(210, 210, 210), 2)
+        self._pen_anchor = QPen(QColor(200, 200, 255, 180), 2)
+        self._pen_anchor_link = QPen(QColor(255, 220, 120, 200), 2)
+        self._color_clear = QColor(10, 10, 10)
+        self._color_viewport = QColor(18, 18, 18)
+        self._color_title = QColor(235, 235, 235)
+        self._color_caption = QColor(170, 170, 170)
+        self._color_text = QColor(200, 200, 200)
+        self._color_station = QColor(120, 180, 255)
+        self._pen_station = QPen(self._color_station, 2)
+        self._color_tracker_ok = QColor(90, 230, 140)
+        self._color_tracker_bad = QColor(255, 140, 90)
+        self._color_anchor = QColor(60, 60, 90, 120)
+        self._color_anchor_text = QColor(200, 200, 255, 200)
 
     def start(self) -> None:
         if self.overlay is None:
@@ -79,6 +144,8 @@ class VRCoachOverlay:
         )
         # wrappers vary in return shape
         self.handle = res[0] if isinstance(res, tuple) and res else res
+        self._set_overlay_raw_fn = _bind_method(self.overlay, "SetOverlayRaw", "setOverlayRaw")
+        self._is_overlay_visible_fn = _bind_method(self.overlay, "IsOverlayVisible", "isOverlayVisible")
 
         _safe_call(self.overlay, "SetOverlayWidthInMeters", "setOverlayWidthInMeters", self.handle, 1.8)
         _safe_call(
@@ -101,6 +168,14 @@ class VRCoachOverlay:
         )
         _safe_call(self.overlay, "ShowOverlay", "showOverlay", self.handle)
         self._visible = True
+        self._frame_key = None
+        self._composited = True
+        self._composited_checked_at = 0.0
+        self._pending = None
+        self._render_stop.clear()
+        self._render_wake.clear()
+        self._render_thread = threading.Thread(target=self._render_loop, name="VRCoachRender", daemon=True)
+        self._render_thread.start()
         log.info("VR Coach overlay started")
 
     def stop(self) -> None:
@@ -108,16 +183,25 @@ class VRCoachOverlay:
             return
         if self.handle is None:
             return
-        try:
-            _safe_call(self.overlay, "HideOverlay", "hideOverlay", self.handle)
-        except Exception:
-            pass
-        try:
-            _safe_call(self.overlay, "DestroyOverlay", "destroyOverlay", self.handle)
-        except Exception:
-            pass
-        self.handle = None
-        self._visible = False
+        # The worker must be idle before the handle it submits to is destroyed.
+        self._render_stop.set()
+        self._render_wake.set()
+        if self._render_thread is not None and self._render_thread.is_alive():
+            # Not held across the join: the worker needs the lock to finish an in-flight upload.
+            self._render_thread.join(timeout=1.0)
+        self._render_thread = None
+        # A worker that outlived the join re-checks the stop flag and handle under this lock before uploading.
+        with self._overlay_lock:
+            try:
+                _safe_call(self.overlay, "HideOverlay", "hideOverlay", self.handle)
+            except Exception:
+                pass
+            try:
+                _safe_call(self.overlay, "DestroyOverlay", "destroyOverlay", self.handle)
+            except Exception:
+                pass
+            self.handle = None
+            self._visible = False
         log.info("VR Coach overlay stopped")
 
     def is_running(self) -> bool:
@@ -127,52 +211,132 @@ class VRCoachOverlay:
         if self.overlay is None or self.handle is None:
             return
         now = time.perf_counter()
-        if fps > 0 and (now - self._last_submit) < (1.0 / fps):
+        if now - self._composited_checked_at >= 0.2:
+            self._composited_checked_at = now
+            fn = self._is_overlay_visible_fn
+            try:
+                with self._overlay_lock:
+                    self._composited = fn is None or bool(fn(self.handle))
+            except Exception:
+                self._composited = True
+        if not self._composited:
+            # Nothing composites the texture; the last upload stays valid for when the overlay is shown again.
             return
-        self._last_submit = now
+        with self._pending_lock:
+            self._pending = (state, history_heatmap, fps)
+        self._render_wake.set()
+
+    def _render_loop(self) -> None:
+        while True:
+            self._render_wake.wait()
+            if self._render_stop.is_set():
+                return
+            with self._pending_lock:
+                job = self._pending
+                if job is None:
+                    self._render_wake.clear()
+                    continue
+            fps = job[2]
+            if fps > 0:
+                # Pace to fps, then take whatever was posted last while waiting.
+                delay = self._last_submit + 1.0 / fps - time.perf_counter()
+                if delay > 0 and self._render_stop.wait(delay):
+                    return
+            with self._pending_lock:
+                job = self._pending
+                self._pending = None
+                self._render_wake.clear()
+            if job is None:
+                continue
+            try:
+                self._submit(job[0], job[1])
+            except Exception as e:
+                log.warning("VR Coach submit failed: %s: %s", type(e).__name__, e)
+
+    def _submit(self, state: Dict, history_heatmap: Optional[Dict]) -> None:
+        # Stamp the tick before the content check so unchanged ticks are paced too (the key is built at most fps/s).
+        self._last_submit = time.perf_counter()
+        # OpenVR keeps showing the last texture, so only rasterize + upload when a drawn input changed.
+        key = self._input_key(state, history_heatmap)
+        if key == self._frame_key:
+            return
+        self._render(state, history_heatmap=history_heatmap)
+        with self._overlay_lock:
+            if self._render_stop.is_set() or self.handle is None:
+                return
+            self._set_overlay_raw_fn(self.handle, self._frame_buf, self.w, self.h, 4)
+        self._frame_key = key
+
+    def _input_key(self, state: Dict, history_heatmap: Optional[Dict]) -> Tuple:
+        # Everything _render reads, reduced to comparable values. The heatmap dict is held by reference (safe: state
+        # and history heatmaps are replaced, never mutated), and the key is compared with ==, which is a deep
+        # content comparison: the same dict short-circuits on identity, while a fresh /state reply's heatmap is
+        # compared cell by cell (a few hundred ints, far cheaper than a redraw + upload).
+        pa = state.get("play_area") or {}
+        corners = pa.get("corners_m") or ()
+        hm = None
+        if self.toggles.heatmap:
+            hm = history_heatmap if (self.toggles.use_history and history_heatmap) else (state.get("heatmap") or None)
+        return (
+            self.toggles.heatmap,
+            self.toggles.body_suggestions,
+            tuple((c[0], c[1]) for c in corners),
+            tuple(
+                (tuple((st.get("pos_m") or ())[:2]), st.get("yaw_deg"))
+                for st in (state.get("stations") or [])[:2]
+            ),
+            tuple(
+                (tr.get("role"), tuple((tr.get("pos_m") or ())[:2]), bool(tr.get("tracking_ok")))
+                for tr in (state.get("trackers") or [])
+            ),
+            hm,
+        )
 
-        img = self._render(state, history_heatmap=history_heatmap)
-        if img.format() != QImage.Format.Format_RGBA8888:
-            img = img.convertToFormat(QImage.Format.Format_RGBA8888)
-        data = img.bits().tobytes()
-        buf = ctypes.create_string_buffer(data, len(data))
-        _safe_call(self.overlay, "SetOverlayRaw", "setOverlayRaw", self.handle, buf, img.width(), img.height(), 4)
+    def _yaw_dir(self, yaw_deg: float) -> Point2:
+        # Station yaw barely changes between frames; cache unit vectors at 0.1 degree resolution.
+        key = int(round(yaw_deg * 10.0))
+        d = self._yaw_dir_cache.get(key)
+        if d is None:
+            if len(self._yaw_dir_cache) >= 64:
+                self._yaw_dir_cache.clear()
+            rad = math.radians(key / 10.0)
+            d = (math.cos(rad), math.sin(rad))
+            self._yaw_dir_cache[key] = d
+        return d
 
     def _render(self, state: Dict, history_heatmap: Optional[Dict]) -> QImage:
-        img = QImage(self.w, self.h, QImage.Format.Format_RGBA8888)
-        img.fill(QColor(10, 10, 10))
+        img = self._frame_img
+        img.fill(self._color_clear)
         p = QPainter(img)
         p.setRenderHint(QPainter.RenderHint.Antialiasing, True)
 
-        title = QFont("Segoe UI", 16)
-        title.setBold(True)
-        p.setFont(title)
-        p.setPen(QColor(235, 235, 235))
+        p.setFont(self._font_title)
+        p.setPen(self._color_title)
         p.drawText(24, 40, "VR Coach")
 
-        p.setFont(QFont("Segoe UI", 11))
-        p.setPen(QColor(170, 170, 170))
+        p.setFont(self._font_caption)
+        p.setPen(self._color_caption)
         p.drawText(24, 66, "World overlay • Esc/Close via dashboard")
 
         # Viewport for playspace visualization.
         x0, y0, w, h = 24, 90, 976, 640
-        p.fillRect(x0, y0, w, h, QColor(18, 18, 18))
-        p.setPen(QPen(QColor(90, 90, 90), 2))
+        p.fillRect(x0, y0, w, h, self._color_viewport)
+        p.setPen(self._pen_border)
         p.setBrush(Qt.BrushStyle.NoBrush)
         p.drawRect(x0, y0, w, h)
 
         pa = (state.get("play_area") or {})
         corners = pa.get("corners_m") or None
         if not corners:
-            p.setPen(QColor(200, 200, 200))
+            p.setPen(self._color_text)
             p.drawText(x0 + 18, y0 + 28, "Play area unavailable")
             p.end()
             return img
 
         pts = [(float(c[0]), float(c[1])) for c in corners]
-        xs = [x for x, _ in pts]
-        ys = [y for _, y in pts]
-        centroid = (sum(xs) / max(1, len(xs)), sum(ys) / max(1, len(ys)))
+        xs, ys = zip(*pts)
+        n = len(pts)
+        centroid = (sum(xs) / n, sum(ys) / n)
         min_x, max_x = min(xs), max(xs)
         min_y, max_y = min(ys), max(ys)
         pad = 0.25
@@ -183,11 +347,12 @@ class VRCoachOverlay:
         sx = w / max(1e-6, (max_x - min_x))
         sy = h / max(1e-6, (max_y - min_y))
         s = min(sx, sy)
+        # Playspace -> pixel is one scale and two offsets; fold the offsets once.
+        ox = x0 - min_x * s
+        oy = y0 + h + min_y * s
 
         def to_px(xm: float, ym: float) -> Point2:
-            px = x0 + (xm - min_x) * s
-            py = y0 + h - (ym - min_y) * s
-            return px, py
+            return ox + xm * s, oy - ym * s
 
         # Heatmap overlay (historical preferred; fallback to live heuristic).
         if self.toggles.heatmap:
@@ -202,33 +367,47 @@ class VRCoachOverlay:
                     if vals is None:
                         vals = hm.get("foot")
                     if vals is not None:
-                        for yi in range(gh):
-                            for xi in range(gw):
-                                v = int(vals[yi * gw + xi])
-                                if v < 0:
-                                    continue
-                                # Normalize to 0..100 for color mapping.
-                                vv = v if "score" in hm else (0 if v <= 0 else (50 if v == 1 else 100))
-                                r = int(max(0, min(255, 255 - (vv * 2))))
-                                g = int(max(0, min(255, vv * 2)))
-                                c = QColor(r, g, 80, 90)
-                                cx = float(origin[0]) + (xi + 0.5) * step
-                                cy = float(origin[1]) + (yi + 0.5) * step
-                                px, py = to_px(cx, cy)
-                                cell_w = step * s
-                                cell_h = step * s
-                                p.fillRect(int(px - cell_w / 2), int(py - cell_h / 2), int(cell_w + 1), int(cell_h + 1), c)
+                        has_score = "score" in hm
+                        cached = self._heat_cells
+                        if (
+                            cached is not None
+                            and cached[0] is vals
+                            and cached[1] == has_score
+                            and cached[2].width() == gw
+                            and cached[2].height() == gh
+                        ):
+                            cells = cached[2]
+                        else:
+                            # One pixel per cell (top row = highest y, since screen y grows downward), then one scaled blit.
+                            pix = _HEAT_PIXELS
+                            rows = []
+                            for yi in range(gh - 1, -1, -1):
+                                row = []
+                                for v in map(int, vals[yi * gw : (yi + 1) * gw]):
+                                    if v < 0:
+                                        row.append(_HEAT_EMPTY)
+                                    elif has_score:
+                                        row.append(pix[min(v, 128)])
+                                    else:
+                                        row.append(pix[0 if v <= 0 else (50 if v == 1 else 100)])
+                                rows.append(b"".join(row))
+                            data = b"".join(rows)
+                            # copy() detaches from `data` so the cached image owns its pixels.
+                            cells = QImage(data, gw, gh, gw * 4, QImage.Format.Format_RGBA8888).copy()
+                            self._heat_cells = (vals, has_score, cells)
+                        left, top = to_px(float(origin[0]), float(origin[1]) + gh * step)
+                        # Hard cell edges, as the old whole-pixel fills had; AA only blends the blit's outer border.
+                        p.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+                        p.drawImage(QRectF(left, top, gw * step * s, gh * step * s), cells)
                 except Exception:
                     pass
+                p.setRenderHint(QPainter.RenderHint.Antialiasing, True)
 
         # Play area outline
-        p.setPen(QPen(QColor(210, 210, 210), 2))
-        for i in range(len(pts)):
-            a = pts[i]
-            b = pts[(i + 1) % len(pts)]
-            ax, ay = to_px(a[0], a[1])
-            bx, by = to_px(b[0], b[1])
-            p.drawLine(int(ax), int(ay), int(bx), int(by))
+        # One closed polyline stroked natively (also joins the corners instead of overlapping line caps).
+        p.setPen(self._pen_outline)
+        p.setBrush(Qt.BrushStyle.NoBrush)
+        p.drawPolygon(QPolygon([QPoint(int(ox + x * s), int(oy - y * s)) for x, y in pts]))
 
         # Base stations: frustum-like wedge
         for st in (state.get("stations") or [])[:2]:
@@ -236,28 +415,32 @@ class VRCoachOverlay:
             yaw = float(st.get("yaw_deg", 0.0))
             px, py = to_px(float(pos[0]), float(pos[1]))
             p.setPen(Qt.PenStyle.NoPen)
-            p.setBrush(QColor(120, 180, 255))
+            p.setBrush(self._color_station)
             p.drawEllipse(int(px - 6), int(py - 6), 12, 12)
-            p.setPen(QPen(QColor(120, 180, 255), 2))
-            dx = math.cos(math.radians(yaw))
-            dy = math.sin(math.radians(yaw))
+            p.setPen(self._pen_station)
+            dx, dy = self._yaw_dir(yaw)
             ex, ey = to_px(float(pos[0]) + dx * 0.7, float(pos[1]) + dy * 0.7)
             p.drawLine(int(px), int(py), int(ex), int(ey))
 
-        # Trackers: points
+        # Trackers: transform all positions first, then draw each tracking-state group under one brush.
         tracker_by_role: Dict[str, Dict] = {}
+        ok_px = []
+        lost_px = []
         for tr in (state.get("trackers") or []):
             pos = tr.get("pos_m")
             if not pos:
                 continue
-            px, py = to_px(float(pos[0]), float(pos[1]))
-            ok = bool(tr.get("tracking_ok"))
-            p.setPen(Qt.PenStyle.NoPen)
-            p.setBrush(QColor(90, 230, 140) if ok else QColor(255, 140, 90))
-            p.drawEllipse(int(px - 5), int(py - 5), 10, 10)
+            dot = (int(ox + float(pos[0]) * s - 5), int(oy - float(pos[1]) * s - 5))
+            (ok_px if tr.get("tracking_ok") else lost_px).append(dot)
             role = str(tr.get("role") or "")
             if role:
                 tracker_by_role[role] = tr
+        p.setPen(Qt.PenStyle.NoPen)
+        for brush, dots in ((self._color_tracker_ok, ok_px), (self._color_tracker_bad, lost_px)):
+            if dots:
+                p.setBrush(brush)
+                for dx, dy in dots:
+                    p.drawEllipse(dx, dy, 10, 10)
 
         # Body placement suggestions (very simple anchors in playspace coordinates).
         if self.toggles.body_suggestions:
@@ -267,21 +450,26 @@ class VRCoachOverlay:
                 "Right Foot": (centroid[0] + 0.18, centroid[1] - 0.10),
                 "Chest": (centroid[0], centroid[1] + 0.12),
             }
-            p.setFont(QFont("Segoe UI", 10))
-            for name, (ax, ay) in anchors.items():
-                px, py = to_px(ax, ay)
-                p.setPen(QPen(QColor(200, 200, 255, 180), 2))
-                p.setBrush(QColor(60, 60, 90, 120))
-                p.drawEllipse(int(px - 6), int(py - 6), 12, 12)
-                p.setPen(QColor(200, 200, 255, 200))
-                p.drawText(int(px + 8), int(py + 4), name)
-
+            # Group by paint state (tracker links, markers, labels) so each pen/brush is set once; links go first
+            # so markers and labels stay on top of them.
+            marks = [(name, *to_px(ax, ay)) for name, (ax, ay) in anchors.items()]
+            links = []
+            for name, px, py in marks:
                 tr = tracker_by_role.get(name)
                 if tr and tr.get("pos_m"):
-                    tx, ty = float(tr["pos_m"][0]), float(tr["pos_m"][1])
-                    tpx, tpy = to_px(tx, ty)
-                    p.setPen(QPen(QColor(255, 220, 120, 200), 2))
-                    p.drawLine(int(tpx), int(tpy), int(px), int(py))
+                    tpx, tpy = to_px(float(tr["pos_m"][0]), float(tr["pos_m"][1]))
+                    links.append(QLine(int(tpx), int(tpy), int(px), int(py)))
+            if links:
+                p.setPen(self._pen_anchor_link)
+                p.drawLines(links)
+            p.setPen(self._pen_anchor)
+            p.setBrush(self._color_anchor)
+            for _, px, py in marks:
+                p.drawEllipse(int(px - 6), int(py - 6), 12, 12)
+            p.setFont(self._font_anchor)
+            p.setPen(self._color_anchor_text)
+            for name, px, py in marks:
+                p.drawText(int(px + 8), int(py + 4), name)
 
         p.end()
         return img